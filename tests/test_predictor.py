@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWebEngineWidgets")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QUrl
+
+import main
+
+
+@pytest.fixture
+def predictor(monkeypatch):
+    monkeypatch.setattr(main.ConnectionPredictor, "load", lambda self: None)
+    return main.ConnectionPredictor()
+
+
+def test_normalize_input_host_port():
+    assert main.normalize_input("localhost:8000") == "http://localhost:8000"
+    assert main.normalize_input("localhost:8000/page") == "http://localhost:8000/page"
+    assert main.normalize_input("example.com:8080") == "https://example.com:8080"
+    assert main.normalize_input("https://example.com") == "https://example.com"
+    assert main.normalize_input("python tutorial") is None
+
+
+def test_url_origin_keeps_port():
+    assert main.url_origin(QUrl(main.normalize_input("localhost:8000"))) == "http://localhost:8000"
+    assert main.url_origin(QUrl("https://example.com:443/a")) == "https://example.com"
+    assert main.url_origin(QUrl("about:blank")) == ""
+
+
+def test_record_navigation_learns_committed_origin(predictor):
+    # Typed google.com, hinted it, but the page committed after a redirect to www
+    warmed = predictor.record_navigation("google.com", "https://www.google.com", ("https://google.com", False))
+    assert not warmed
+    assert predictor.stats["misses"] == 1
+    assert predictor.predict("goo") == "https://www.google.com"
+
+    warmed = predictor.record_navigation("goo", "https://www.google.com", ("https://www.google.com", False))
+    assert warmed
+    assert predictor.stats["hits"] == 1
+
+
+def test_search_hints_stay_out_of_hit_rate(predictor):
+    warmed = predictor.record_navigation("weather", "https://www.google.com", ("https://www.google.com", True), learn=False)
+    assert warmed
+    assert predictor.stats["hits"] == predictor.stats["misses"] == 0
+    assert predictor.predict("weather") is None
+
+
+def test_new_subresource_displaces_old(predictor):
+    site = QUrl("https://site.com")
+    for i in range(4 * predictor.MAX_SUBRESOURCES):
+        for _ in range(2):
+            predictor.record_subresource(site, QUrl(f"https://h{i}.com"))
+    predictor.record_subresource(site, QUrl("https://new.com"))
+    assert "https://new.com" in predictor.subresources["https://site.com"]